@@ -0,0 +1,8 @@
+# compile_rules.py
+
+import sys
+
+from controllers.bulk_controller import run_bulk
+
+if __name__ == "__main__":
+    sys.exit(run_bulk())
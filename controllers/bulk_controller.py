@@ -0,0 +1,29 @@
+# controllers/bulk_controller.py
+
+import argparse
+
+from models.bulk_compiler import compilar_en_lote, leer_reglas
+from views.cli_view import show_bulk_result
+
+
+def run_bulk(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compila en paralelo un archivo de reglas (un patrón por línea) "
+                    "a un bundle precompilado.")
+    parser.add_argument("reglas", help="archivo de reglas")
+    parser.add_argument("-o", "--salida", help="bundle de salida (por defecto: <reglas>.bundle)")
+    parser.add_argument("-p", "--procesos", type=int, default=None,
+                        help="número de procesos (por defecto: núcleos disponibles)")
+    args = parser.parse_args(argv)
+
+    # 1) Leer patrones
+    patrones = leer_reglas(args.reglas)
+
+    # 2) Compilar en paralelo
+    resultado = compilar_en_lote(patrones, procesos=args.procesos)
+
+    # 3) Guardar el bundle y mostrar el resumen
+    salida = args.salida or args.reglas + ".bundle"
+    resultado.guardar(salida)
+    show_bulk_result(resultado, salida)
+    return 1 if resultado.errores else 0
@@ -1,9 +1,11 @@
 # controllers/main_controller.py
 
 from models.regex_parser import RegexParser
+from models.regex_optimizer import RegexOptimizer
 from models.syntax_tree import SyntaxTree
 from models.dfa import DFA
 from models.mindfa import minimize_dfa
+from models.dictionary_dfa import es_alternancia_literal, construir_dfa_diccionario
 from views.cli_view import (
     ask_for_regex,
     ask_for_num_strings,
@@ -17,21 +19,34 @@ def run_app():
     # 1) Solicitar regex al usuario
     user_regex = ask_for_regex()
     
-    # 2) Parsear regex -> notación postfija
-    parser = RegexParser(user_regex)
-    postfix = parser.parse()
+    # 1.1) Modo diccionario: una alternancia de palabras literales se construye
+    #      directamente como AFD mínimo, sin árbol sintáctico ni minimización
+    palabras = es_alternancia_literal(user_regex)
+    if palabras is not None:
+        show_message(f"Modo diccionario: {len(palabras)} palabra(s)")
+        dfa = construir_dfa_diccionario(palabras)
+        min_dfa = dfa
+    else:
+        # 2) Parsear regex -> notación postfija
+        parser = RegexParser(user_regex)
+        postfix = parser.parse()
 
-    # 3) Construir árbol sintáctico
-    syntax_tree = SyntaxTree(postfix)
+        # 2.1) Simplificar la expresión para reducir el número de posiciones
+        optimizer = RegexOptimizer(postfix)
+        postfix = optimizer.optimize()
+        show_message(optimizer.reporte())
 
-    # 4) Mostar árbol sintáctico
-    syntax_tree.render("syntax_tree")
+        # 3) Construir árbol sintáctico
+        syntax_tree = SyntaxTree(postfix)
 
-    # 4) Construir DFA usando algoritmo directo
-    dfa = DFA(syntax_tree)
+        # 4) Mostar árbol sintáctico
+        syntax_tree.render("syntax_tree")
 
-    # 5) Minimizar el DFA
-    min_dfa = minimize_dfa(dfa)
+        # 4) Construir DFA usando algoritmo directo
+        dfa = DFA(syntax_tree)
+
+        # 5) Minimizar el DFA
+        min_dfa = minimize_dfa(dfa)
 
     # 6) Mostrar DFA original por consola
     show_message("\n=== DFA original ===")
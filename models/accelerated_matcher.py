@@ -0,0 +1,118 @@
+# models/accelerated_matcher.py
+
+import re
+from itertools import islice
+
+
+def analizar_aceleracion(dfa, min_simbolos=1):
+    """
+    Análisis en tiempo de compilación: devuelve {estado: (bucles, escapes)} para los
+    estados "acelerables", es decir, los que tienen una transición a sí mismos con al
+    menos 'min_simbolos' símbolos. 'bucles' son los símbolos que no cambian de estado
+    y 'escapes' los del alfabeto que sí lo cambian (cualquier otro carácter lleva al
+    estado muerto).
+    """
+    acelerables = {}
+    for state, trans in dfa.transitions.items():
+        bucles = frozenset(simbolo for simbolo, destino in trans.items() if destino == state)
+        if bucles and len(bucles) >= min_simbolos:
+            acelerables[state] = (bucles, frozenset(dfa.alphabet) - bucles)
+    return acelerables
+
+
+# Caracteres que se recorren uno a uno antes de recurrir a 're': la llamada tiene un
+# costo fijo que solo compensa en rachas largas
+PASOS_CORTOS = 8
+
+
+class AcceleratedMatcher:
+    """
+    Simulación de un DFA que salta las rachas de caracteres en los estados con bucle
+    (p. ej. [a-z]* o el q2 -b-> q2 de (a|b)*abb). Para cada estado acelerable se
+    precompila una expresión de 're' con su clase de bucle. En ejecución se avanza
+    carácter por carácter como DFA.simulate; solo cuando un estado acelerable lleva
+    PASOS_CORTOS pasos seguidos en su bucle, patron.match(cadena, i).end() recorre el
+    resto de la racha a velocidad de C. Al salir del salto, un carácter que no está en
+    'escapes' lleva al estado muerto y se rechaza sin consultar la tabla de transiciones.
+    """
+
+    def __init__(self, dfa, min_simbolos=1, pasos_cortos=PASOS_CORTOS):
+        self.transitions = dfa.transitions
+        self.initial_state = dfa.initial_state
+        self.accepting_states = dfa.accepting_states
+        self.acelerables = analizar_aceleracion(dfa, min_simbolos)
+        self.pasos_cortos = pasos_cortos
+        # estado -> método match de la expresión '[bucles]*'
+        self.saltos = {
+            state: re.compile("[" + "".join(re.escape(c) for c in sorted(bucles)) + "]*").match
+            for state, (bucles, _) in self.acelerables.items()
+        }
+
+    def simulate(self, cadena):
+        """Igual que DFA.simulate, pero saltando los bucles largos de los estados acelerables."""
+        transitions = self.transitions
+        saltos = self.saltos
+        pasos_cortos = self.pasos_cortos
+        state = self.initial_state
+        racha = 0
+        caracteres = enumerate(cadena)
+        for i, ch in caracteres:
+            siguiente = transitions[state].get(ch)
+            if siguiente is None:
+                return False
+            if siguiente != state:
+                state = siguiente
+                racha = 0
+                continue
+            racha += 1
+            if racha < pasos_cortos or state not in saltos:
+                continue
+            # Racha larga en un estado acelerable: se salta el resto con 're'
+            racha = 0
+            fin = saltos[state](cadena, i + 1).end()
+            if fin == len(cadena):
+                break
+            # cadena[fin] no es un símbolo de bucle: si tampoco es de escape, muere
+            if cadena[fin] not in self.acelerables[state][1]:
+                return False
+            next(islice(caracteres, fin - i - 1, fin - i - 1), None)
+        return state in self.accepting_states
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from models.regex_parser import RegexParser
+    from models.syntax_tree import SyntaxTree
+    from models.dfa import DFA
+    from models.mindfa import minimize_dfa
+
+    random.seed(0)
+    # (descripción, patrón, cadenas): con rachas largas y con entrada uniforme
+    cargas = [
+        ("sesgada 30:1 hacia b", "(a|b)*abb#",
+         ["".join(random.choice("ab" + "b" * 30) for _ in range(2000)) + "abb"
+          for _ in range(500)]),
+        ("uniforme", "(a|b)*abb#",
+         ["".join(random.choice("ab") for _ in range(2000)) + "abb" for _ in range(500)]),
+        ("rachas largas", "[a-z]*x[0-9]*#",
+         ["".join(random.choice("abcdefghijklmnopqrstuvwyz") for _ in range(2000))
+          + "x" + "7" * 500 for _ in range(500)]),
+        ("uniforme", "[a-z0-9]*x[0-9]*#",
+         ["".join(random.choice("abcx0123") for _ in range(2000)) for _ in range(500)]),
+    ]
+    for descripcion, regex, cadenas in cargas:
+        dfa = minimize_dfa(DFA(SyntaxTree(RegexParser(regex).parse())))
+        matcher = AcceleratedMatcher(dfa)
+
+        inicio = time.perf_counter()
+        esperado = [dfa.simulate(s) for s in cadenas]
+        normal = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resultados = [matcher.simulate(s) for s in cadenas]
+        acelerado = time.perf_counter() - inicio
+
+        assert resultados == esperado
+        print(f"{regex} ({descripcion}): simulate {normal:.3f}s, acelerado {acelerado:.3f}s "
+              f"({len(matcher.acelerables)} estado(s) acelerable(s))")
@@ -0,0 +1,124 @@
+# models/batch_matcher.py
+
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from models.dfa_table import TablaDFA, simular
+
+# Estado de cada proceso trabajador (se llena en _iniciar_trabajador)
+_shm = None
+_tabla = None
+_aceptacion = None
+_columnas = None
+_ncols = 0
+_estado_inicial = 0
+
+
+def _iniciar_trabajador(nombre, alfabeto, num_estados, estado_inicial):
+    global _shm, _tabla, _aceptacion, _columnas, _ncols, _estado_inicial
+    # Los trabajadores comparten el resource_tracker del padre, que es quien libera el bloque
+    _shm = SharedMemory(name=nombre)
+    _ncols = len(alfabeto)
+    bytes_tabla = num_estados * _ncols * 4
+    # Vistas sin copia sobre el bloque: primero la tabla (int32), luego la aceptación
+    _tabla = _shm.buf[:bytes_tabla].cast('i')
+    _aceptacion = _shm.buf[bytes_tabla:bytes_tabla + num_estados]
+    _columnas = {simbolo: col for col, simbolo in enumerate(alfabeto)}
+    _estado_inicial = estado_inicial
+
+
+def _procesar_bloque(cadenas):
+    """Simula cada cadena del bloque y devuelve un byte por cadena (1 = aceptada)."""
+    return bytes(simular(cadena, _tabla, _aceptacion, _columnas, _ncols, _estado_inicial)
+                 for cadena in cadenas)
+
+
+class BatchMatcher:
+    """
+    Clasificación masiva de cadenas con un pool de procesos. La tabla de transiciones
+    se publica una sola vez en multiprocessing.shared_memory y cada trabajador la usa
+    directamente, sin recibir una copia serializada del DFA.
+
+    Uso:
+        with BatchMatcher(dfa, procesos=4) as matcher:
+            resultados = matcher.match(cadenas)  # bytearray, un 0/1 por cadena
+    """
+
+    def __init__(self, dfa, procesos=None, tam_bloque=None):
+        self.tabla = dfa if isinstance(dfa, TablaDFA) else TablaDFA.desde_dfa(dfa)
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tam_bloque = tam_bloque
+        self.shm = None
+        self.pool = None
+        self.publicar()
+
+    def publicar(self):
+        """Copia la tabla y los estados de aceptación a un bloque de memoria compartida."""
+        datos_tabla = self.tabla.tabla.tobytes()
+        tam = len(datos_tabla) + self.tabla.num_estados
+        self.shm = SharedMemory(create=True, size=max(tam, 1))
+        self.shm.buf[:len(datos_tabla)] = datos_tabla
+        self.shm.buf[len(datos_tabla):tam] = bytes(self.tabla.aceptacion)
+
+        self.pool = Pool(self.procesos, initializer=_iniciar_trabajador,
+                         initargs=(self.shm.name, self.tabla.alfabeto,
+                                   self.tabla.num_estados, self.tabla.estado_inicial))
+
+    def match(self, cadenas):
+        """
+        Devuelve un bytearray con un byte por cadena, en el mismo orden de entrada:
+        1 si la cadena es aceptada, 0 en caso contrario.
+        """
+        if self.pool is None:
+            raise ValueError("El BatchMatcher ya fue cerrado.")
+        cadenas = list(cadenas)
+        tam = self.tam_bloque or max(1, -(-len(cadenas) // (self.procesos * 4)))
+        bloques = [cadenas[i:i + tam] for i in range(0, len(cadenas), tam)]
+
+        resultado = bytearray()
+        # imap conserva el orden de los bloques
+        for parcial in self.pool.imap(_procesar_bloque, bloques):
+            resultado += parcial
+        return resultado
+
+    def close(self):
+        """Detiene el pool y libera la memoria compartida."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from models.regex_parser import RegexParser
+    from models.syntax_tree import SyntaxTree
+    from models.dfa import DFA
+    from models.mindfa import minimize_dfa
+
+    regex = "(a|b)*abb#"
+    dfa = minimize_dfa(DFA(SyntaxTree(RegexParser(regex).parse())))
+    cadenas = ["".join(random.choice("ab") for _ in range(200)) for _ in range(50000)]
+
+    inicio = time.perf_counter()
+    esperado = [dfa.simulate(s) for s in cadenas]
+    print(f"Secuencial: {time.perf_counter() - inicio:.2f}s")
+
+    for procesos in (1, 2, 4):
+        with BatchMatcher(dfa, procesos=procesos) as matcher:
+            inicio = time.perf_counter()
+            resultados = matcher.match(cadenas)
+            print(f"{procesos} proceso(s): {time.perf_counter() - inicio:.2f}s")
+        assert [bool(r) for r in resultados] == esperado
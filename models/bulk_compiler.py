@@ -0,0 +1,102 @@
+# models/bulk_compiler.py
+
+import os
+import pickle
+from multiprocessing import Pool
+
+from models.regex_parser import RegexParser
+from models.regex_optimizer import RegexOptimizer
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.mindfa import minimize_dfa
+from models.dictionary_dfa import es_alternancia_literal, construir_dfa_diccionario
+from models.dfa_table import TablaDFA
+
+# Identificador y versión del formato del bundle precompilado
+FORMATO_BUNDLE = ("regex-bundle", 1)
+
+
+def compilar_patron(patron):
+    """
+    Pipeline completo de un patrón: parser -> optimizador -> árbol -> AFD -> mínimo.
+    Como en RegexSet, el marcador de fin '#' es opcional: si falta, se agrega.
+    """
+    if not patron.endswith('#') or patron.endswith('\\#'):
+        patron += '#'
+    if patron == '#':
+        raise ValueError("El patrón está vacío.")
+    palabras = es_alternancia_literal(patron)
+    if palabras is not None:
+        return TablaDFA.desde_dfa(construir_dfa_diccionario(palabras))
+    postfix = RegexOptimizer(RegexParser(patron).parse()).optimize()
+    return TablaDFA.desde_dfa(minimize_dfa(DFA(SyntaxTree(postfix))))
+
+
+def _compilar_bloque(patrones):
+    """
+    Compila un bloque de patrones en un proceso trabajador. Devuelve, por patrón,
+    (tabla, None) o (None, mensaje_de_error): un patrón inválido no aborta el lote.
+    """
+    resultados = []
+    for patron in patrones:
+        try:
+            resultados.append((compilar_patron(patron), None))
+        except Exception as e:
+            resultados.append((None, f"{type(e).__name__}: {e}"))
+    return resultados
+
+
+class ResultadoLote:
+    """Tablas compiladas (None si falló) y errores {índice: mensaje}, en orden de entrada."""
+
+    def __init__(self, patrones, tablas, errores):
+        self.patrones = patrones
+        self.tablas = tablas
+        self.errores = errores
+
+    def guardar(self, ruta):
+        """Escribe todo el lote en un único bundle que los servicios cargan al arrancar."""
+        with open(ruta, "wb") as archivo:
+            pickle.dump((FORMATO_BUNDLE, self.patrones, self.tablas, self.errores),
+                        archivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def compilar_en_lote(patrones, procesos=None, tam_bloque=None):
+    """
+    Reparte los patrones en bloques entre un pool de procesos. Cada trabajador devuelve
+    TablaDFA (arrays planos, baratos de serializar) en lugar del grafo de objetos
+    del árbol sintáctico y del AFD.
+    """
+    patrones = list(patrones)
+    procesos = procesos or os.cpu_count() or 1
+    tam = tam_bloque or max(1, -(-len(patrones) // (procesos * 4)))
+    bloques = [patrones[i:i + tam] for i in range(0, len(patrones), tam)]
+
+    if procesos == 1:
+        parciales = map(_compilar_bloque, bloques)
+        resultados = [r for parcial in parciales for r in parcial]
+    else:
+        with Pool(procesos) as pool:
+            resultados = [r for parcial in pool.imap(_compilar_bloque, bloques) for r in parcial]
+
+    tablas = [tabla for tabla, _ in resultados]
+    errores = {idx: error for idx, (_, error) in enumerate(resultados) if error is not None}
+    return ResultadoLote(patrones, tablas, errores)
+
+
+def leer_reglas(ruta):
+    """Lee un archivo de reglas: un patrón por línea, se ignoran las líneas vacías."""
+    with open(ruta, encoding="utf-8") as archivo:
+        return [linea.strip() for linea in archivo if linea.strip()]
+
+
+def cargar_bundle(ruta):
+    """
+    Carga un bundle escrito por ResultadoLote.guardar. Usa pickle: solo se deben cargar
+    bundles generados por uno mismo.
+    """
+    with open(ruta, "rb") as archivo:
+        formato, patrones, tablas, errores = pickle.load(archivo)
+    if formato != FORMATO_BUNDLE:
+        raise ValueError(f"Formato de bundle no soportado: {formato}")
+    return ResultadoLote(patrones, tablas, errores)
@@ -0,0 +1,263 @@
+# models/capture.py
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree, NodoHoja, NodoBinario, NodoUnario
+
+
+class TaggedDFA:
+    """
+    Extracción de grupos de captura sin backtracking. Los grupos '( )' del patrón se
+    registran en los nodos del árbol sintáctico y cada arista de followpos (p -> q) se
+    etiqueta con la secuencia de aperturas y cierres de grupos que recorre, incluidos
+    los grupos anulables que quedan vacíos entre p y q.
+
+    Para elegir el mismo camino que 're' ante ambigüedad, los estados de la
+    construcción de subconjuntos son tuplas de posiciones ordenadas por prioridad
+    (la alternativa izquierda antes que la derecha, repetir antes que salir de un
+    '*'), y una posición q de T se queda con la primera posición p de S que la
+    alcanza. Cada transición S --c--> T guarda para cada q de T ese origen p y sus
+    etiquetas (transiciones etiquetadas). Una iteración vacía de un '*' termina la
+    repetición, como en 're'.
+
+    match() hace una pasada lineal hacia adelante guardando los estados, y otra hacia
+    atrás siguiendo las transiciones etiquetadas desde el marcador '#' de mayor
+    prioridad: cada paso es una consulta O(1), sin backtracking. Si una repetición
+    captura varias veces, queda la última iteración (como en 're').
+    """
+
+    def __init__(self, regex):
+        parser = RegexParser(regex, captures=True)
+        self.postfix = parser.parse()
+        self.num_grupos = parser.num_groups
+        raiz = SyntaxTree(self.postfix).raiz
+
+        self.programa = []
+        self.simbolos = {}  # posición -> caracteres que acepta
+        self.despues = {}   # posición -> instrucción que sigue a consumirla
+        self.num_bucles = 0
+        entrada = self.compilar(raiz, self.instruccion(('fin',)))
+        self.marcadores = {pos for pos, simbolos in self.simbolos.items() if '#' in simbolos}
+        self.iniciales = self.clausura(entrada)
+        self.siguientes = {pos: self.clausura(pc) for pos, pc in self.despues.items()}
+        self.build_tagged_transitions()
+
+    def instruccion(self, instr):
+        self.programa.append(instr)
+        return len(self.programa) - 1
+
+    def compilar(self, node, siguiente):
+        """
+        Traduce el subárbol a instrucciones que continúan en 'siguiente' y devuelve la
+        primera. Las alternativas se prueban en orden: primero la de la izquierda.
+        """
+        if node.grupos:
+            siguiente = self.instruccion(('etiqueta', tuple(('cierra', g) for g in node.grupos),
+                                          siguiente))
+        if isinstance(node, NodoHoja):
+            if node.valor == 'ε':
+                inicio = siguiente
+            else:
+                self.simbolos[node.posicion] = node.simbolos
+                self.despues[node.posicion] = siguiente
+                inicio = self.instruccion(('posicion', node.posicion, siguiente))
+        elif isinstance(node, NodoBinario):
+            if node.valor == '.':
+                inicio = self.compilar(node.izquierdo, self.compilar(node.derecho, siguiente))
+            else:
+                izquierdo = self.compilar(node.izquierdo, siguiente)
+                derecho = self.compilar(node.derecho, siguiente)
+                inicio = self.instruccion(('alternativa', izquierdo, derecho))
+        else:
+            bucle = self.num_bucles
+            self.num_bucles += 1
+            cabeza = self.instruccion(None)  # se completa al compilar el cuerpo
+            cuerpo = self.compilar(node.hijo, cabeza)
+            self.programa[cabeza] = ('repetir', bucle, cuerpo, siguiente)
+            inicio = self.instruccion(('entrar', bucle, cabeza))
+        if node.grupos:
+            inicio = self.instruccion(('etiqueta', tuple(('abre', g) for g in reversed(node.grupos)),
+                                       inicio))
+        return inicio
+
+    def clausura(self, pc):
+        """
+        Posiciones alcanzables desde 'pc' sin consumir caracteres, en orden de prioridad:
+        {posición: etiquetas del camino de mayor prioridad}. 'vacios' son los bucles
+        cuya iteración empezó en este mismo desplazamiento; si vuelven a su cabeza sin
+        consumir nada, la repetición termina.
+        """
+        programa = self.programa
+        resultado = {}
+        vistos = set()
+        pendientes = [(pc, frozenset(), ())]
+        while pendientes:
+            pc, vacios, etiquetas = pendientes.pop()
+            if (pc, vacios) in vistos:
+                continue
+            vistos.add((pc, vacios))
+            instr = programa[pc]
+            tipo = instr[0]
+            if tipo == 'posicion':
+                resultado.setdefault(instr[1], etiquetas)
+            elif tipo == 'alternativa':
+                pendientes.append((instr[2], vacios, etiquetas))
+                pendientes.append((instr[1], vacios, etiquetas))
+            elif tipo == 'etiqueta':
+                pendientes.append((instr[2], vacios, etiquetas + instr[1]))
+            elif tipo == 'entrar':
+                pendientes.append((instr[2], vacios - {instr[1]}, etiquetas))
+            elif tipo == 'repetir':
+                _, bucle, cuerpo, salida = instr
+                pendientes.append((salida, vacios, etiquetas))
+                if bucle not in vacios:
+                    pendientes.append((cuerpo, vacios | {bucle}, etiquetas))
+        return resultado
+
+    def build_tagged_transitions(self):
+        """
+        Construcción de subconjuntos sobre tuplas ordenadas de posiciones. Para cada
+        transición S --c--> T guarda {q en T: (p, etiquetas)}, con p la primera
+        posición de S (en orden de prioridad) con símbolo c que alcanza q.
+        """
+        inicial = tuple(self.iniciales)
+        self.states = {inicial: 0}
+        self.transitions = {}
+        self.tagged = {}
+        pendientes = [inicial]
+        while pendientes:
+            estado = pendientes.pop()
+            state_id = self.states[estado]
+            por_simbolo = {}
+            for p in estado:
+                for simbolo in self.simbolos[p]:
+                    if simbolo == '#':
+                        continue
+                    origenes = por_simbolo.setdefault(simbolo, {})
+                    for q, etiquetas in self.siguientes[p].items():
+                        if q not in origenes:
+                            origenes[q] = (p, etiquetas)
+            self.transitions[state_id] = {}
+            self.tagged[state_id] = {}
+            for simbolo, origenes in por_simbolo.items():
+                if not origenes:
+                    continue
+                destino = tuple(origenes)
+                if destino not in self.states:
+                    self.states[destino] = len(self.states)
+                    pendientes.append(destino)
+                self.transitions[state_id][simbolo] = self.states[destino]
+                self.tagged[state_id][simbolo] = origenes
+        self.initial_state = 0
+        # Marcador '#' de mayor prioridad de cada estado de aceptación
+        self.marcador_final = {}
+        for estado, state_id in self.states.items():
+            for q in estado:
+                if q in self.marcadores:
+                    self.marcador_final[state_id] = q
+                    break
+
+    def match(self, cadena):
+        """
+        Si la cadena completa es aceptada, devuelve la lista de spans [(inicio, fin) o
+        None] con el span 0 para la cadena completa y luego uno por grupo, como
+        re.Match.span(k). Si no es aceptada, devuelve None.
+        """
+        transitions = self.transitions
+
+        # 1) Pasada hacia adelante: estados en cada frontera
+        estados = [self.initial_state]
+        state = self.initial_state
+        for ch in cadena:
+            state = transitions[state].get(ch)
+            if state is None:
+                return None
+            estados.append(state)
+        if state not in self.marcador_final:
+            return None
+
+        # 2) Pasada hacia atrás: posición de cada carácter y etiquetas de cada frontera
+        n = len(cadena)
+        q = self.marcador_final[state]
+        etiquetas = [None] * (n + 1)
+        for i in range(n, 0, -1):
+            p, etiquetas[i] = self.tagged[estados[i - 1]][cadena[i - 1]][q]
+            q = p
+        etiquetas[0] = self.iniciales[q]
+
+        # 3) Aplicar las etiquetas en orden
+        inicio = [None] * (self.num_grupos + 1)
+        spans = [None] * (self.num_grupos + 1)
+        spans[0] = (0, n)
+        for offset, ops in enumerate(etiquetas):
+            for op, g in ops:
+                if op == 'abre':
+                    inicio[g] = offset
+                else:
+                    spans[g] = (inicio[g], offset)
+        return spans
+
+    def groups(self, cadena):
+        """Como re.fullmatch(...).groups(): tupla de subcadenas (o None) por grupo."""
+        spans = self.match(cadena)
+        if spans is None:
+            return None
+        return tuple(None if span is None else cadena[span[0]:span[1]] for span in spans[1:])
+
+
+def benchmark(regex, cadenas, repeticiones=3):
+    """
+    Compara TaggedDFA.groups con re.fullmatch(...).groups() sobre las mismas cadenas.
+    El patrón se escribe con la sintaxis del proyecto (terminado en '#'); para 're' se
+    quita el marcador. Devuelve (segundos_tagged, segundos_re, distintos): los mejores
+    tiempos de cada uno y cuántas cadenas dieron grupos distintos de 're'.
+    """
+    import re
+    import time
+
+    tagged = TaggedDFA(regex)
+    patron = re.compile(regex[:-1])
+
+    def medir(funcion):
+        mejor = None
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            for cadena in cadenas:
+                funcion(cadena)
+            total = time.perf_counter() - inicio
+            mejor = total if mejor is None else min(mejor, total)
+        return mejor
+
+    def con_re(cadena):
+        m = patron.fullmatch(cadena)
+        return m.groups() if m else None
+
+    distintos = sum(tagged.groups(cadena) != con_re(cadena) for cadena in cadenas)
+    return medir(tagged.groups), medir(con_re), distintos
+
+
+if __name__ == "__main__":
+    import random
+
+    random.seed(0)
+    cargas = {
+        "([0-9]+)\\-([0-9]+)\\-([0-9]+)#": [
+            f"{random.randint(1900, 2100)}-{random.randint(1, 12)}-{random.randint(1, 31)}"
+            for _ in range(20000)
+        ],
+        "([a-z]+)\\@([a-z]+)\\.(com|org|net)#": [
+            "".join(random.choice("abcdefgh") for _ in range(random.randint(3, 12)))
+            + "@" + "".join(random.choice("xyz") for _ in range(random.randint(2, 8)))
+            + "." + random.choice(["com", "org", "net"])
+            for _ in range(20000)
+        ],
+        "([a-z]+)\\=([a-z0-9]*)(\\;[a-z]*)*#": [
+            "".join(random.choice("abcxyz") for _ in range(random.randint(1, 8))) + "="
+            + "".join(random.choice("abc123") for _ in range(random.randint(0, 6)))
+            + ";" * random.randint(0, 2)
+            for _ in range(20000)
+        ],
+    }
+    for regex, cadenas in cargas.items():
+        segundos_tagged, segundos_re, distintos = benchmark(regex, cadenas)
+        print(f"{regex}: TaggedDFA {segundos_tagged:.3f}s, re {segundos_re:.3f}s "
+              f"({distintos} resultado(s) distinto(s) de 're')")
@@ -8,8 +8,29 @@ class DFA:
         # Calcula la función followpos y el mapeo de posiciones a símbolos
         self.followpos = self.compute_followpos(syntax_tree.raiz)
         self.pos_to_symbol = self.compute_pos_to_symbol(syntax_tree.raiz)
+        self.pos_to_chars = self.compute_pos_to_chars(syntax_tree.raiz)
+        self.initial_positions = frozenset(syntax_tree.raiz.firstpos)
+        self.init_automaton()
+
+    @classmethod
+    def from_followpos(cls, firstpos, followpos, pos_to_symbol, pos_to_chars):
+        """
+        Construye el AFD a partir de firstpos(raíz), followpos y el mapeo de posiciones,
+        ya calculados (por ejemplo, por SubtreeCache), sin recorrer un árbol sintáctico.
+        """
+        dfa = cls.__new__(cls)
+        dfa.syntax_tree = None
+        dfa.followpos = followpos
+        dfa.pos_to_symbol = pos_to_symbol
+        dfa.pos_to_chars = pos_to_chars
+        dfa.initial_positions = frozenset(firstpos)
+        dfa.init_automaton()
+        return dfa
+
+    def init_automaton(self):
         # Definir el alfabeto (excluimos el marcador '#' de entrada)
-        self.alphabet = {symbol for pos, symbol in self.pos_to_symbol.items() if symbol != '#'}
+        self.alphabet = {symbol for pos, chars in self.pos_to_chars.items()
+                         if self.pos_to_symbol[pos] != '#' for symbol in chars}
         # Diccionario para almacenar los estados (clave: frozenset de posiciones, valor: ID del estado)
         self.states = {}
         # Tabla de transiciones: {estado_id: {símbolo: estado_id_destino}}
@@ -67,8 +88,23 @@ class DFA:
         traverse(node)
         return pos_to_symbol
 
+    def compute_pos_to_chars(self, node):
+        """Crea un diccionario que mapea cada posición al conjunto de caracteres que acepta."""
+        pos_to_chars = {}
+
+        def traverse(n):
+            if isinstance(n, NodoHoja):
+                pos_to_chars[n.posicion] = n.simbolos
+            elif isinstance(n, NodoBinario):
+                traverse(n.izquierdo)
+                traverse(n.derecho)
+            elif isinstance(n, NodoUnario):
+                traverse(n.hijo)
+        traverse(node)
+        return pos_to_chars
+
     def build_dfa(self):
-        initial = frozenset(self.syntax_tree.raiz.firstpos)
+        initial = self.initial_positions
         self.states[initial] = 0
         self.initial_state = 0
         unmarked_states = [initial]
@@ -82,7 +118,7 @@ class DFA:
             for symbol in self.alphabet:
                 u = set()
                 for pos in current:
-                    if self.pos_to_symbol[pos] == symbol:
+                    if symbol in self.pos_to_chars[pos]:
                         u.update(self.followpos[pos])
                 if u:
                     u = frozenset(u)
@@ -0,0 +1,73 @@
+# models/dfa_table.py
+
+from array import array
+
+# Valor de la tabla para "no hay transición" (estado muerto)
+MUERTO = -1
+
+
+class TablaDFA:
+    """
+    Representación compacta de un DFA: una tabla densa de transiciones en un array de
+    enteros de 32 bits (fila = estado, columna = símbolo del alfabeto) y un bytearray
+    con los estados de aceptación. A diferencia del diccionario anidado
+    DFA.transitions, se puede serializar barato y publicar en memoria compartida.
+    """
+
+    def __init__(self, alfabeto, num_estados, estado_inicial, tabla, aceptacion):
+        self.alfabeto = alfabeto  # str con los símbolos en orden de columna
+        self.columnas = {simbolo: col for col, simbolo in enumerate(alfabeto)}
+        self.num_estados = num_estados
+        self.estado_inicial = estado_inicial
+        self.tabla = tabla  # array('i') de num_estados * len(alfabeto)
+        self.aceptacion = aceptacion  # bytes/bytearray de num_estados (1 = aceptación)
+
+    @classmethod
+    def desde_dfa(cls, dfa):
+        """Compila un DFA (original o minimizado) a su tabla densa."""
+        alfabeto = "".join(sorted(dfa.alphabet))
+        columnas = {simbolo: col for col, simbolo in enumerate(alfabeto)}
+        # Renumerar los estados de forma contigua
+        ids = {estado: idx for idx, estado in enumerate(sorted(dfa.transitions))}
+        ncols = len(alfabeto)
+
+        tabla = array('i', [MUERTO]) * (len(ids) * ncols)
+        for estado, trans in dfa.transitions.items():
+            fila = ids[estado] * ncols
+            for simbolo, destino in trans.items():
+                tabla[fila + columnas[simbolo]] = ids[destino]
+
+        aceptacion = bytearray(len(ids))
+        for estado in dfa.accepting_states:
+            aceptacion[ids[estado]] = 1
+
+        return cls(alfabeto, len(ids), ids[dfa.initial_state], tabla, aceptacion)
+
+    def simulate(self, cadena):
+        """Igual que DFA.simulate, pero sobre la tabla densa."""
+        return simular(cadena, self.tabla, self.aceptacion, self.columnas,
+                       len(self.alfabeto), self.estado_inicial)
+
+    def __getstate__(self):
+        # 'columnas' se reconstruye a partir del alfabeto
+        return (self.alfabeto, self.num_estados, self.estado_inicial,
+                self.tabla, bytes(self.aceptacion))
+
+    def __setstate__(self, estado):
+        self.__init__(*estado)
+
+
+def simular(cadena, tabla, aceptacion, columnas, ncols, estado_inicial):
+    """
+    Recorre la tabla densa con la cadena. 'tabla' puede ser un array o una vista
+    de memoria (memoryview.cast('i')) sobre un bloque de memoria compartida.
+    """
+    estado = estado_inicial
+    for ch in cadena:
+        col = columnas.get(ch)
+        if col is None:
+            return False
+        estado = tabla[estado * ncols + col]
+        if estado == MUERTO:
+            return False
+    return aceptacion[estado] == 1
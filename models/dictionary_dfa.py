@@ -0,0 +1,132 @@
+# models/dictionary_dfa.py
+
+from collections import deque
+
+from models.dfa import DFA
+
+
+def es_alternancia_literal(regex):
+    """
+    Si la expresión es una alternancia de palabras literales, devuelve la lista de
+    palabras; si no, devuelve None. Se reconocen:
+        (foo|bar|baz)#     palabra#     (foo)#
+    Los caracteres escapados (\\x) cuentan como literales. Sin paréntesis, el parser
+    asocia '#' solo con la última alternativa (a|b# == a|(b#)), por eso una
+    alternancia de varias palabras debe ir entre paréntesis.
+    """
+    if not regex.endswith('#') or regex.endswith('\\#'):
+        return None
+    cuerpo = regex[:-1]
+    agrupado = cuerpo.startswith('(') and cuerpo.endswith(')') and not cuerpo.endswith('\\)')
+    if agrupado:
+        cuerpo = cuerpo[1:-1]
+
+    palabras = []
+    actual = []
+    escapado = False
+    for char in cuerpo:
+        if escapado:
+            actual.append(char)
+            escapado = False
+        elif char == '\\':
+            escapado = True
+        elif char == '|':
+            if not agrupado:
+                return None
+            palabras.append("".join(actual))
+            actual = []
+        elif char.isalnum():
+            actual.append(char)
+        else:
+            return None
+    if escapado:
+        return None
+    palabras.append("".join(actual))
+    if any(not palabra for palabra in palabras):
+        return None
+    return palabras
+
+
+def construir_dfa_diccionario(palabras):
+    """
+    Construye directamente el AFD mínimo y acíclico que acepta exactamente las
+    palabras dadas, con el algoritmo incremental para entrada ordenada de
+    Daciuk et al. (2000). No hace falta árbol sintáctico ni minimización: cada
+    sufijo terminado se sustituye por un estado equivalente ya registrado.
+    """
+    palabras = sorted(set(palabras))
+    if not palabras:
+        raise ValueError("La lista de palabras está vacía.")
+
+    transiciones = [{}]   # estado -> {símbolo: estado}
+    finales = [False]
+    registro = {}         # firma (final, transiciones) -> estado representante
+    sin_revisar = []      # camino de la última palabra: (padre, símbolo, hijo)
+
+    def minimizar(hasta):
+        # Registra (o sustituye por su equivalente) los estados del camino por
+        # debajo del prefijo común, del más profundo hacia arriba
+        while len(sin_revisar) > hasta:
+            padre, simbolo, hijo = sin_revisar.pop()
+            firma = (finales[hijo], tuple(sorted(transiciones[hijo].items())))
+            if firma in registro:
+                transiciones[padre][simbolo] = registro[firma]
+            else:
+                registro[firma] = hijo
+
+    anterior = ""
+    for palabra in palabras:
+        # Longitud del prefijo común con la palabra anterior
+        comun = 0
+        for a, b in zip(palabra, anterior):
+            if a != b:
+                break
+            comun += 1
+        minimizar(comun)
+
+        estado = sin_revisar[-1][2] if sin_revisar else 0
+        for simbolo in palabra[comun:]:
+            nuevo = len(transiciones)
+            transiciones.append({})
+            finales.append(False)
+            transiciones[estado][simbolo] = nuevo
+            sin_revisar.append((estado, simbolo, nuevo))
+            estado = nuevo
+        finales[estado] = True
+        anterior = palabra
+    minimizar(0)
+
+    # Renumerar los estados alcanzables (los sustituidos quedan huérfanos)
+    ids = {0: 0}
+    cola = deque([0])
+    while cola:
+        estado = cola.popleft()
+        for destino in transiciones[estado].values():
+            if destino not in ids:
+                ids[destino] = len(ids)
+                cola.append(destino)
+
+    dfa = DFA.__new__(DFA)  # creamos una instancia vacía de DFA, como en minimize_dfa
+    dfa.syntax_tree = None
+    dfa.alphabet = {simbolo for palabra in palabras for simbolo in palabra}
+    dfa.states = {frozenset({nuevo}): nuevo for nuevo in ids.values()}
+    dfa.transitions = {ids[estado]: {simbolo: ids[destino]
+                                     for simbolo, destino in transiciones[estado].items()}
+                       for estado in ids}
+    dfa.initial_state = 0
+    dfa.accepting_states = {ids[estado] for estado in ids if finales[estado]}
+    dfa.followpos = None  # no hay posiciones
+    dfa.pos_to_symbol = None
+    dfa.pos_to_chars = None
+    dfa.initial_positions = None
+    return dfa
+
+
+if __name__ == "__main__":
+    regex = "(tap|taps|top|tops|stop|stops)#"
+    palabras = es_alternancia_literal(regex)
+    print("Palabras:", palabras)
+    dfa = construir_dfa_diccionario(palabras)
+    dfa.print_dfa()
+    for s in ["tap", "tops", "sto", "stops", "taps"]:
+        print(f"'{s}': {dfa.simulate(s)}")
@@ -0,0 +1,170 @@
+# models/fuzzy_matcher.py
+
+# Id del estado del producto sin pares: ninguna continuación puede aceptar
+MUERTO = -1
+
+
+class FuzzyMatcher:
+    """
+    Búsqueda aproximada: cadenas a lo sumo a 'k' ediciones (inserción, borrado o
+    sustitución de un carácter) de alguna cadena aceptada por el DFA.
+
+    Se explora la intersección del DFA con un autómata de Levenshtein: cada estado
+    es un conjunto de pares (estado_dfa, ediciones), quedándose con el mínimo de
+    ediciones por estado. Esos conjuntos se determinizan de forma perezosa: cada
+    transición se calcula la primera vez que se necesita y queda en caché, así que para
+    k pequeño el recorrido es lineal en la longitud de la entrada (una consulta a un
+    diccionario por carácter).
+    """
+
+    def __init__(self, dfa, k, max_estados=100000):
+        if k < 0:
+            raise ValueError("El número de ediciones k debe ser >= 0.")
+        self.transitions = dfa.transitions
+        self.accepting_states = dfa.accepting_states
+        self.k = k
+        self.max_estados = max_estados
+        self.pares_inicial = self.cerradura({dfa.initial_state: 0})
+        # Cada estado del producto se interna como un entero la primera vez que se
+        # construye: así las claves de las cachés son (id, símbolo) y no la tupla
+        # completa de pares, que habría que volver a hashear en cada carácter.
+        self.ids = {}         # tupla de pares -> id
+        self.estados = []     # id -> tupla de pares
+        self.distancias = []  # id -> menor número de ediciones con que acepta, o None
+        # Caché de la determinización perezosa: (id, símbolo) -> id
+        self.cache_fullmatch = {}
+        self.cache_search = {}
+        self.inicial = self.internar(self.pares_inicial)
+
+    def internar(self, pares):
+        """Devuelve el id del estado del producto (MUERTO si no quedan pares)."""
+        if not pares:
+            return MUERTO
+        estado = self.ids.get(pares)
+        if estado is None:
+            estado = len(self.estados)
+            self.ids[pares] = estado
+            self.estados.append(pares)
+            aceptadas = [e for q, e in pares if q in self.accepting_states]
+            self.distancias.append(min(aceptadas) if aceptadas else None)
+        return estado
+
+    def reiniciar_tablas(self):
+        """Vacía la tabla de estados internados y las cachés que dependen de sus ids."""
+        self.ids.clear()
+        del self.estados[:]
+        del self.distancias[:]
+        self.cache_fullmatch.clear()
+        self.cache_search.clear()
+        self.inicial = self.internar(self.pares_inicial)
+
+    def cerradura(self, pares):
+        """
+        Aplica los borrados (saltar un símbolo del patrón sin consumir entrada) y
+        devuelve el estado como tupla ordenada de pares (estado_dfa, ediciones).
+        """
+        pendientes = list(pares.items())
+        while pendientes:
+            q, e = pendientes.pop()
+            if e >= self.k or pares[q] < e:
+                continue
+            for destino in self.transitions[q].values():
+                if e + 1 < pares.get(destino, self.k + 1):
+                    pares[destino] = e + 1
+                    pendientes.append((destino, e + 1))
+        return tuple(sorted(pares.items()))
+
+    def paso(self, estado, simbolo, reiniciar):
+        """Calcula la transición del autómata producto con 'simbolo'."""
+        k = self.k
+        nuevos = {}
+        for q, e in estado:
+            trans = self.transitions[q]
+            destino = trans.get(simbolo)
+            if destino is not None and e < nuevos.get(destino, k + 1):
+                nuevos[destino] = e  # coincidencia
+            if e < k:
+                if e + 1 < nuevos.get(q, k + 1):
+                    nuevos[q] = e + 1  # inserción: el símbolo sobra en la entrada
+                for otro, destino in trans.items():
+                    if otro != simbolo and e + 1 < nuevos.get(destino, k + 1):
+                        nuevos[destino] = e + 1  # sustitución
+        if reiniciar:
+            # En search() una coincidencia puede empezar en cualquier posición
+            for q, e in self.pares_inicial:
+                if e < nuevos.get(q, k + 1):
+                    nuevos[q] = e
+        return self.cerradura(nuevos)
+
+    def transicion(self, cache, estado, simbolo, reiniciar):
+        clave = (estado, simbolo)
+        siguiente = cache.get(clave)
+        if siguiente is None:
+            pares = self.paso(self.estados[estado], simbolo, reiniciar)
+            if len(self.estados) >= self.max_estados:
+                # Los ids cambian: no se guarda la clave del estado de origen
+                self.reiniciar_tablas()
+                return self.internar(pares)
+            if len(cache) >= self.max_estados:
+                cache.clear()
+            siguiente = self.internar(pares)
+            cache[clave] = siguiente
+        return siguiente
+
+    def distancia(self, estado):
+        """Menor número de ediciones con el que el estado acepta, o None."""
+        return self.distancias[estado]
+
+    def fullmatch(self, cadena):
+        """Distancia de edición de la cadena completa al lenguaje (si es <= k), o None."""
+        estado = self.inicial
+        cache = self.cache_fullmatch
+        for simbolo in cadena:
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion(cache, estado, simbolo, False)
+            estado = siguiente
+            if estado == MUERTO:
+                return None
+        return self.distancia(estado)
+
+    def search(self, cadena):
+        """
+        Menor distancia de edición entre alguna subcadena y el lenguaje (si es <= k),
+        o None. Se detiene en cuanto encuentra una coincidencia exacta.
+        """
+        estado = self.inicial
+        cache = self.cache_search
+        mejor = self.distancia(estado)
+        for simbolo in cadena:
+            if mejor == 0:
+                return 0
+            siguiente = cache.get((estado, simbolo))
+            if siguiente is None:
+                siguiente = self.transicion(cache, estado, simbolo, True)
+            estado = siguiente
+            d = self.distancia(estado)
+            if d is not None and (mejor is None or d < mejor):
+                mejor = d
+        return mejor
+
+    def batch(self, cadenas, modo="fullmatch"):
+        """Aplica fullmatch o search a cada cadena; devuelve las distancias en orden."""
+        if modo not in ("fullmatch", "search"):
+            raise ValueError(f"Modo no soportado: {modo}")
+        funcion = self.fullmatch if modo == "fullmatch" else self.search
+        return [funcion(cadena) for cadena in cadenas]
+
+
+if __name__ == "__main__":
+    from models.regex_parser import RegexParser
+    from models.syntax_tree import SyntaxTree
+    from models.dfa import DFA
+    from models.mindfa import minimize_dfa
+
+    regex = "(color|colour)s*#"
+    dfa = minimize_dfa(DFA(SyntaxTree(RegexParser(regex).parse())))
+    matcher = FuzzyMatcher(dfa, k=2)
+    cadenas = ["color", "colr", "kolour", "colours", "cool", "xx"]
+    print("fullmatch:", dict(zip(cadenas, matcher.batch(cadenas))))
+    print("search:", matcher.search("the colr of the sky"))
@@ -127,6 +127,8 @@ def minimize_dfa(dfa: DFA) -> DFA:
     min_dfa.accepting_states = new_accepting_states
     min_dfa.followpos = None  # ya no es relevante
     min_dfa.pos_to_symbol = None  # ya no es relevante
+    min_dfa.pos_to_chars = None  # ya no es relevante
+    min_dfa.initial_positions = None  # ya no es relevante
     return min_dfa
 
 
@@ -0,0 +1,253 @@
+# models/regex_optimizer.py
+
+from models.regex_parser import Symbol
+
+# Literales especiales que nunca se fusionan en una clase de caracteres
+ESPECIALES = {'#', 'ε'}
+
+
+class RegexOptimizer:
+    """
+    Simplificación algebraica de la expresión postfija, entre RegexParser.to_postfix
+    y SyntaxTree. Reescribe la expresión en una forma normalizada que acepta el mismo
+    lenguaje pero con menos posiciones (hojas) en el árbol sintáctico:
+      - elimina alternativas repetidas: a|a -> a, (x|y)|x -> x|y
+      - colapsa cerraduras anidadas: (a*)* -> a*, (a*|b)* -> (a|b)*, a*a* -> a*
+      - fusiona alternancias de un solo carácter en una clase: a|b|c -> [a-c]
+      - factoriza prefijos y sufijos comunes: ab|ac -> a(b|c), ac|bc -> [ab]c
+
+    Internamente la expresión se representa con tuplas (hashables):
+      ('set', frozenset)  clase de caracteres (un literal normal es una clase de tamaño 1)
+      ('lit', c)          literal especial ('#' o 'ε')
+      ('cat', (n1, n2, ...))
+      ('alt', (n1, n2, ...))
+      ('star', n)
+    """
+
+    def __init__(self, postfix):
+        self.postfix = postfix
+        self.posiciones_antes = contar_posiciones(postfix)
+        self.posiciones_despues = None
+
+    def optimize(self):
+        """Devuelve una nueva lista postfija simplificada."""
+        arbol = self.construir(self.postfix)
+        salida = []
+        self.emitir(arbol, salida)
+        self.posiciones_despues = contar_posiciones(salida)
+        return salida
+
+    def reporte(self):
+        """Resumen del número de posiciones antes y después de optimizar."""
+        return f"Posiciones: {self.posiciones_antes} -> {self.posiciones_despues}"
+
+    # ------------------------------------------------------------------
+    # Construcción de la representación interna
+    # ------------------------------------------------------------------
+    def construir(self, postfix):
+        """
+        Primero agrupa cada cadena de '|' (y de '.') en un solo nodo n-ario, y luego
+        normaliza cada nodo una única vez. Normalizar en cada '|' binario volvería a
+        procesar toda la lista acumulada y sería cuadrático en el número de alternativas.
+        """
+        stack = []
+        for token in postfix:
+            if not token.is_operator:
+                if token.chars:
+                    stack.append(('set', frozenset(token.chars)))
+                elif token.value in ESPECIALES:
+                    stack.append(('lit', token.value))
+                else:
+                    stack.append(('set', frozenset({token.value})))
+            elif token.value == '*':
+                if not stack:
+                    raise ValueError("El operador '*' no tiene un operando válido.")
+                stack.append(['*', stack.pop()])
+            elif token.value in {'.', '|'}:
+                if len(stack) < 2:
+                    raise ValueError(f"El operador '{token.value}' no tiene dos operandos.")
+                derecho = stack.pop()
+                izquierdo = stack.pop()
+                # Los nodos n-arios en construcción son listas [op, hijo1, hijo2, ...]
+                if isinstance(izquierdo, list) and izquierdo[0] == token.value:
+                    nodo = izquierdo
+                else:
+                    nodo = [token.value, izquierdo]
+                if isinstance(derecho, list) and derecho[0] == token.value:
+                    nodo.extend(derecho[1:])
+                else:
+                    nodo.append(derecho)
+                stack.append(nodo)
+            else:
+                raise ValueError(f"Operador no soportado por el optimizador: {token.value}")
+        if len(stack) != 1:
+            raise ValueError("La expresión postfija está incompleta.")
+        return self.normalizar(stack.pop())
+
+    def normalizar(self, nodo):
+        """Convierte el árbol n-ario en la representación normalizada (tuplas)."""
+        if isinstance(nodo, tuple):
+            return nodo
+        if nodo[0] == '*':
+            return self.cerradura(self.normalizar(nodo[1]))
+        hijos = [self.normalizar(hijo) for hijo in nodo[1:]]
+        if nodo[0] == '.':
+            return self.concatenacion(hijos)
+        return self.alternancia(hijos)
+
+    def cerradura(self, nodo):
+        # (a*)* -> a*
+        if nodo[0] == 'star':
+            return nodo
+        # (a*|b)* -> (a|b)*
+        if nodo[0] == 'alt' and any(hijo[0] == 'star' for hijo in nodo[1]):
+            nodo = self.alternancia([hijo[1] if hijo[0] == 'star' else hijo
+                                     for hijo in nodo[1]])
+            if nodo[0] == 'star':
+                return nodo
+        return ('star', nodo)
+
+    def concatenacion(self, nodos):
+        items = []
+        for nodo in nodos:
+            for item in (nodo[1] if nodo[0] == 'cat' else (nodo,)):
+                # a*a* -> a*
+                if item[0] == 'star' and items and items[-1] == item:
+                    continue
+                items.append(item)
+        if len(items) == 1:
+            return items[0]
+        return ('cat', tuple(items))
+
+    def alternancia(self, nodos):
+        # 1) Aplanar y eliminar duplicados conservando el orden
+        items = []
+        vistos = set()
+        for nodo in nodos:
+            for item in (nodo[1] if nodo[0] == 'alt' else (nodo,)):
+                if item not in vistos:
+                    vistos.add(item)
+                    items.append(item)
+
+        # 2) Fusionar todas las clases en una sola, en el lugar de la primera
+        clases = [item for item in items if item[0] == 'set']
+        if len(clases) > 1:
+            fusion = ('set', frozenset().union(*(c[1] for c in clases)))
+            primera = items.index(clases[0])
+            items = [item for item in items if item[0] != 'set']
+            items.insert(primera, fusion)
+
+        # 3) Factorizar prefijos y luego sufijos comunes
+        items = self.factorizar(items, 0)
+        items = self.factorizar(items, -1)
+
+        if len(items) == 1:
+            return items[0]
+        return ('alt', tuple(items))
+
+    def factorizar(self, items, extremo):
+        """
+        Agrupa las alternativas que comparten el primer (extremo=0) o último (extremo=-1)
+        factor y extrae de una vez el prefijo (o sufijo) común más largo del grupo, sin
+        una llamada recursiva por factor. Solo se factoriza si todas las alternativas del
+        grupo dejan un resto no vacío, ya que no hay forma de representar ε sin añadir
+        una posición.
+        """
+        secuencias = [item[1] if item[0] == 'cat' else (item,) for item in items]
+        grupos = {}
+        for idx, seq in enumerate(secuencias):
+            grupos.setdefault(seq[extremo], []).append(idx)
+
+        resultado = []
+        usados = set()
+        for idx, item in enumerate(items):
+            if idx in usados:
+                continue
+            miembros = grupos[secuencias[idx][extremo]]
+            if len(miembros) < 2 or any(len(secuencias[m]) < 2 for m in miembros):
+                resultado.append(item)
+                continue
+            usados.update(miembros)
+            # Longitud del prefijo (o sufijo) común, dejando al menos un factor de resto
+            referencia = secuencias[idx]
+            maximo = min(len(secuencias[m]) for m in miembros) - 1
+            largo = 1
+            while largo < maximo:
+                k = largo if extremo == 0 else -1 - largo
+                if any(secuencias[m][k] != referencia[k] for m in miembros):
+                    break
+                largo += 1
+            restos = []
+            for m in miembros:
+                resto = secuencias[m][largo:] if extremo == 0 else secuencias[m][:-largo]
+                restos.append(resto[0] if len(resto) == 1 else ('cat', resto))
+            resto_alt = self.alternancia(restos)
+            if extremo == 0:
+                resultado.append(self.concatenacion([*referencia[:largo], resto_alt]))
+            else:
+                resultado.append(self.concatenacion([resto_alt, *referencia[-largo:]]))
+        if len(resultado) == len(items):
+            return resultado
+        # La factorización pudo dejar nuevas alternativas duplicadas o fusionables
+        nodo = self.alternancia(resultado)
+        return list(nodo[1]) if nodo[0] == 'alt' else [nodo]
+
+    # ------------------------------------------------------------------
+    # Emisión de la notación postfija
+    # ------------------------------------------------------------------
+    def emitir(self, nodo, salida):
+        tipo = nodo[0]
+        if tipo == 'lit':
+            salida.append(Symbol(nodo[1], is_operator=False))
+        elif tipo == 'set':
+            chars = nodo[1]
+            if len(chars) == 1:
+                salida.append(Symbol(next(iter(chars)), is_operator=False))
+            else:
+                salida.append(Symbol(etiqueta_clase(chars), is_operator=False, chars=chars))
+        elif tipo == 'star':
+            self.emitir(nodo[1], salida)
+            salida.append(Symbol('*', is_operator=True))
+        else:
+            operador = '.' if tipo == 'cat' else '|'
+            hijos = nodo[1]
+            self.emitir(hijos[0], salida)
+            for hijo in hijos[1:]:
+                self.emitir(hijo, salida)
+                salida.append(Symbol(operador, is_operator=True))
+
+
+def contar_posiciones(postfix):
+    """Número de hojas (posiciones) que tendrá el árbol sintáctico."""
+    return sum(1 for token in postfix if not token.is_operator)
+
+
+def etiqueta_clase(chars):
+    """Representa una clase de caracteres compactando rangos consecutivos: [a-z0-9]."""
+    codigos = sorted(ord(c) for c in chars)
+    partes = []
+    inicio = previo = codigos[0]
+    for codigo in codigos[1:] + [None]:
+        if codigo is not None and codigo == previo + 1:
+            previo = codigo
+            continue
+        if previo - inicio >= 2:
+            partes.append(f"{chr(inicio)}-{chr(previo)}")
+        else:
+            partes.extend(chr(c) for c in range(inicio, previo + 1))
+        if codigo is not None:
+            inicio = previo = codigo
+    return "[" + "".join(partes) + "]"
+
+
+if __name__ == "__main__":
+    from models.regex_parser import RegexParser
+
+    regex = "((a|a)(b*)*(x|y)|x[a-z]c|xyc)#"
+    parser = RegexParser(regex)
+    postfix = parser.parse()
+    optimizer = RegexOptimizer(postfix)
+    optimizado = optimizer.optimize()
+    print("Postfix:", [str(token) for token in postfix])
+    print("Optimizado:", [str(token) for token in optimizado])
+    print(optimizer.reporte())
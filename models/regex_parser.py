@@ -2,9 +2,14 @@ import re
 from collections import deque
 
 class Symbol:
-    def __init__(self, value, is_operator=False):
+    def __init__(self, value, is_operator=False, chars=None, group=None):
         self.value = value
         self.is_operator = is_operator
+        # Conjunto de caracteres que acepta un literal de clase (p. ej. '[abc]').
+        # Para un literal normal es None y solo acepta su propio valor.
+        self.chars = chars
+        # Número del grupo de captura que abre un '(' escrito por el usuario
+        self.group = group
 
     def __str__(self):
         return self.value
@@ -16,9 +21,12 @@ class RegexParser:
     OPERATORS = {'|', '.', '*', '+'} 
     PRECEDENCE = {'|': 1, '.': 2, '*': 3, '+': 3} 
 
-    def __init__(self, regex):
+    def __init__(self, regex, captures=False):
         self.regex = regex
         self.tokens = []
+        # Si es True, to_postfix emite un marcador '()' al cerrar cada grupo de captura
+        self.captures = captures
+        self.num_groups = 0
     
     def should_concat(self, last_token, current_token_type):
         """
@@ -101,6 +109,7 @@ class RegexParser:
         output = []
         last_token = None 
         escaped = False
+        self.num_groups = 0
 
         skip_until = -1
         
@@ -162,19 +171,25 @@ class RegexParser:
                     # Caso: el '+' se aplica a un grupo.
                     # Buscar el paréntesis de apertura que corresponde al último ')'.
                     group_start = None
+                    depth = 0
                     for idx in range(len(output) - 1, -1, -1):
-                        if output[idx].value == '(':
-                            group_start = idx
-                            break
+                        if output[idx].value == ')':
+                            depth += 1
+                        elif output[idx].value == '(':
+                            depth -= 1
+                            if depth == 0:
+                                group_start = idx
+                                break
                     if group_start is None:
                         raise ValueError("No se encontró '(' que corresponda al ')'.")
                     # Copiar los tokens que componen el grupo (sin contar los paréntesis)
-                    group_tokens = [Symbol(tok.value, tok.is_operator) for tok in output[group_start+1: len(output)-1]
-                                   ]
+                    group_tokens = [Symbol(tok.value, tok.is_operator, tok.chars, tok.group)
+                                    for tok in output[group_start+1: len(output)-1]]
                     # Insertar concatenación explícita antes de la copia del grupo
                     output.append(Symbol('.', is_operator=True))
                     # Envolver la copia en paréntesis para que se trate como un subgrupo completo
-                    output.append(Symbol('(', is_operator=True))
+                    # La copia captura en el mismo grupo (gana la última iteración)
+                    output.append(Symbol('(', is_operator=True, group=output[group_start].group))
                     output.extend(group_tokens)
                     output.append(Symbol(')', is_operator=True))
                     # Agregar el operador '*'
@@ -199,7 +214,8 @@ class RegexParser:
             elif char == '(':
                 if self.should_concat(last_token, 'group_start'):
                     output.append(Symbol('.', is_operator=True))
-                token = Symbol('(', is_operator=True)
+                self.num_groups += 1
+                token = Symbol('(', is_operator=True, group=self.num_groups)
                 output.append(token)
                 last_token = None
                 continue
@@ -231,7 +247,9 @@ class RegexParser:
             elif token.value == ')':
                 while stack and stack[-1].value != '(':
                     output.append(stack.pop())
-                stack.pop()  # Descarta el '('
+                opening = stack.pop()  # Descarta el '('
+                if self.captures and opening.group is not None:
+                    output.append(Symbol('()', is_operator=True, group=opening.group))
             elif token.value in {'|', '.'}:  # operadores binarios
                 while (stack and stack[-1].value in {'|', '.'} and
                        self.PRECEDENCE[token.value] <= self.PRECEDENCE[stack[-1].value]):
@@ -0,0 +1,138 @@
+# models/regex_set.py
+
+from models.regex_parser import RegexParser, Symbol
+from models.regex_optimizer import RegexOptimizer
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+
+
+class RegexSet:
+    """
+    Conjunto de reglas compiladas con la construcción directa en un único árbol
+    sintáctico: (r1 #1) | (r2 #2) | ... donde cada regla recibe su propio marcador de fin.
+    Cada estado del DFA resultante guarda el conjunto de reglas cuyos marcadores
+    contiene, de modo que una sola pasada sobre la cadena devuelve todas las reglas
+    que la aceptan.
+
+    Si el conjunto es muy grande, las reglas se reparten en varios DFAs combinados
+    (shards) de a lo sumo 'max_posiciones' posiciones cada uno.
+    """
+
+    def __init__(self, patrones, max_posiciones=2000, optimizar=True):
+        # Se aceptan una lista (ids = índices) o un diccionario {id: patrón}
+        if hasattr(patrones, 'items'):
+            reglas = list(patrones.items())
+        else:
+            reglas = list(enumerate(patrones))
+        self.max_posiciones = max_posiciones
+        self.optimizar = optimizar
+        self.shards = []
+        self.construir([(id_regla, self.compilar(id_regla, patron))
+                        for id_regla, patron in reglas])
+
+    def compilar(self, id_regla, patron):
+        """Convierte un patrón (sin marcador de fin) a notación postfija."""
+        # El marcador lo agrega RegexSet; se ignora uno final escrito por el usuario
+        if patron.endswith('#') and not patron.endswith('\\#'):
+            patron = patron[:-1]
+        if not patron:
+            raise ValueError(f"La regla {id_regla!r} está vacía.")
+        try:
+            postfix = RegexParser(patron).parse()
+            if self.optimizar:
+                postfix = RegexOptimizer(postfix).optimize()
+        except (ValueError, IndexError, RecursionError) as e:
+            raise ValueError(f"Regla {id_regla!r} inválida: {e}") from e
+        return postfix
+
+    def construir(self, compiladas):
+        """Agrupa las reglas en shards y construye un DFA combinado por shard."""
+        grupo = []
+        posiciones = 0
+        for id_regla, postfix in compiladas:
+            tam = sum(1 for token in postfix if not token.is_operator) + 1
+            if grupo and posiciones + tam > self.max_posiciones:
+                self.shards.append(ShardDFA(grupo))
+                grupo = []
+                posiciones = 0
+            grupo.append((id_regla, postfix))
+            posiciones += tam
+        if grupo:
+            self.shards.append(ShardDFA(grupo))
+
+    def match(self, cadena):
+        """Devuelve la lista de ids de las reglas que aceptan la cadena completa."""
+        encontradas = []
+        for shard in self.shards:
+            encontradas.extend(shard.match(cadena))
+        return encontradas
+
+    def __len__(self):
+        return sum(len(shard.ids) for shard in self.shards)
+
+
+class ShardDFA:
+    """Un DFA combinado para un subconjunto de las reglas de un RegexSet."""
+
+    def __init__(self, reglas):
+        self.ids = [id_regla for id_regla, _ in reglas]
+        combinado = []
+        # posición del marcador de fin -> id de la regla
+        marcador_a_regla = {}
+        posicion = 0
+        for id_regla, postfix in reglas:
+            posicion += sum(1 for token in postfix if not token.is_operator)
+            # Las posiciones se asignan en orden de aparición de las hojas (desde 1)
+            posicion += 1
+            marcador_a_regla[posicion] = id_regla
+        self.emitir_alternancia(reglas, 0, len(reglas), combinado)
+
+        self.dfa = DFA(SyntaxTree(combinado))
+        self.transitions = self.dfa.transitions
+        self.initial_state = self.dfa.initial_state
+
+        # Reglas aceptadas en cada estado, en el orden en que se dieron
+        orden = {id_regla: idx for idx, id_regla in enumerate(self.ids)}
+        self.reglas_por_estado = {}
+        for state_set, state_id in self.dfa.states.items():
+            aceptadas = [marcador_a_regla[pos] for pos in state_set if pos in marcador_a_regla]
+            if aceptadas:
+                self.reglas_por_estado[state_id] = tuple(sorted(aceptadas, key=orden.get))
+
+    def emitir_alternancia(self, reglas, inicio, fin, salida):
+        """
+        Emite (r #) | (r #) | ... para reglas[inicio:fin] como un árbol equilibrado: una
+        cadena de '|' tendría tantos niveles como reglas y DFA.compute_followpos (que es
+        recursivo) fallaría con miles de palabras clave. Las hojas quedan en el mismo
+        orden, así que las posiciones de los marcadores no cambian.
+        """
+        if fin - inicio == 1:
+            salida.extend(reglas[inicio][1])
+            salida.append(Symbol('#', is_operator=False))
+            salida.append(Symbol('.', is_operator=True))
+            return
+        medio = (inicio + fin) // 2
+        self.emitir_alternancia(reglas, inicio, medio, salida)
+        self.emitir_alternancia(reglas, medio, fin, salida)
+        salida.append(Symbol('|', is_operator=True))
+
+    def match(self, cadena):
+        state = self.initial_state
+        transitions = self.transitions
+        for ch in cadena:
+            state = transitions[state].get(ch)
+            if state is None:
+                return ()
+        return self.reglas_por_estado.get(state, ())
+
+
+if __name__ == "__main__":
+    reglas = {
+        "fecha": "[0-9][0-9]\\-[0-9][0-9]",
+        "numero": "[0-9]+",
+        "abb": "(a|b)*abb",
+        "ab": "(a|b)+",
+    }
+    conjunto = RegexSet(reglas)
+    for s in ["12-05", "2024", "aabb", "ab", "abc"]:
+        print(f"'{s}': {conjunto.match(s)}")
@@ -0,0 +1,69 @@
+# models/stream_matcher.py
+
+
+class StreamMatcher:
+    """
+    Simulación incremental de un DFA para flujos que llegan por partes (sockets, pipes).
+    Solo guarda el estado actual: cada fragmento se recorre en el momento en que llega,
+    sin acumular la entrada ni copiarla. En cuanto el autómata cae en un estado muerto
+    (no hay transición), deja de consumir caracteres.
+
+    Uso:
+        matcher = StreamMatcher(dfa)
+        for chunk in flujo:
+            if not matcher.feed(chunk):
+                break  # ninguna continuación puede ser aceptada
+        matcher.is_accepting()
+    """
+
+    def __init__(self, dfa):
+        self.transitions = dfa.transitions
+        self.initial_state = dfa.initial_state
+        self.accepting_states = dfa.accepting_states
+        self.reset()
+
+    def reset(self):
+        """Vuelve al estado inicial para procesar un nuevo mensaje."""
+        self.current_state = self.initial_state
+        self.consumed = 0  # caracteres consumidos antes de morir (o en total)
+
+    def feed(self, chunk):
+        """
+        Consume un fragmento de la entrada. Devuelve False si el autómata quedó en un
+        estado muerto (el resto del flujo ya no necesita leerse), True en caso contrario.
+        """
+        state = self.current_state
+        if state is None:
+            return False
+        transitions = self.transitions
+        consumed = len(chunk)
+        for i, ch in enumerate(chunk):
+            state = transitions[state].get(ch)
+            if state is None:
+                consumed = i
+                break
+        self.consumed += consumed
+        self.current_state = state
+        return state is not None
+
+    def is_accepting(self):
+        """True si la entrada consumida hasta ahora es aceptada por el DFA."""
+        return self.current_state in self.accepting_states
+
+    def is_dead(self):
+        """True si ninguna continuación de la entrada puede ser aceptada."""
+        return self.current_state is None
+
+
+if __name__ == "__main__":
+    from models.regex_parser import RegexParser
+    from models.syntax_tree import SyntaxTree
+    from models.dfa import DFA
+
+    regex = "(a|b)*abb#"
+    dfa = DFA(SyntaxTree(RegexParser(regex).parse()))
+    matcher = StreamMatcher(dfa)
+
+    for chunk in ["ab", "aab", "", "b"]:
+        matcher.feed(chunk)
+        print(f"Fragmento '{chunk}': aceptada={matcher.is_accepting()} muerta={matcher.is_dead()}")
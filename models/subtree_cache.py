@@ -0,0 +1,207 @@
+# models/subtree_cache.py
+
+from collections import OrderedDict
+
+from models.dfa import DFA
+
+
+class Fragmento:
+    """
+    Subárbol ya compilado, con posiciones relativas 1..tam. Guarda lo que la
+    construcción directa calcula para él: nullable, firstpos, lastpos, el followpos
+    interno y el símbolo (y conjunto de caracteres) de cada posición.
+    """
+
+    def __init__(self, tam, nullable, firstpos, lastpos, followpos, simbolos, chars):
+        self.tam = tam
+        self.nullable = nullable
+        self.firstpos = firstpos      # frozenset de posiciones relativas
+        self.lastpos = lastpos
+        self.followpos = followpos    # {pos: conjunto de posiciones}
+        self.simbolos = simbolos      # secuencia, simbolos[pos - 1]
+        self.chars = chars            # secuencia de frozensets, chars[pos - 1]
+
+
+def desplazar(posiciones, offset):
+    """Reubica un conjunto de posiciones sumándoles 'offset'."""
+    return frozenset(p + offset for p in posiciones)
+
+
+class SubtreeCache:
+    """
+    Caché de subárboles compilados, compartida entre varias expresiones. Un subárbol
+    ocupa un tramo contiguo de la notación postfija, y ese tramo (operadores y hojas
+    con su conjunto de caracteres) es su clave de contenido: dos subárboles iguales
+    tienen la misma clave sin importar en qué expresión aparezcan.
+
+    Al compilar una expresión, followpos se construye en un único diccionario mutable
+    con posiciones absolutas, como en DFA.compute_followpos, y los símbolos en una
+    lista. Los subárboles que están en la caché se injertan desplazando sus
+    posiciones; los demás se calculan en su lugar. Solo al guardar una entrada se
+    materializa una copia con posiciones relativas. Para no guardar cada eslabón de
+    una concatenación larga, solo se cachean los subárboles "completos": los
+    operandos de '|' y '*', el operando derecho de '.' (un grupo entre paréntesis)
+    y la raíz.
+    """
+
+    def __init__(self, max_entradas=10000, min_posiciones=2):
+        self.max_entradas = max_entradas
+        self.min_posiciones = min_posiciones
+        self.entradas = OrderedDict()  # tramo postfijo -> Fragmento (orden LRU)
+        self.aciertos = 0
+        self.fallos = 0
+
+    def analizar(self, postfix):
+        """
+        Primera pasada (barata): arma los nodos sin calcular followpos. Devuelve la
+        lista de nodos (op, hijos, inicio, base, tam), donde postfix[inicio:idx + 1] es
+        el tramo del nodo y base el número de posiciones anteriores a él; además la
+        descripción de cada token, qué nodos se pueden cachear y el índice de la raíz.
+        """
+        nodos = []
+        descripcion = []
+        cacheable = []
+        stack = []
+        posiciones = 0
+        for idx, token in enumerate(postfix):
+            if not token.is_operator:
+                chars = frozenset(token.chars) if getattr(token, 'chars', None) else None
+                descripcion.append((token.value, chars))
+                nodos.append(('hoja', (), idx, posiciones, 1))
+                posiciones += 1
+            elif token.value == '*':
+                hijo = stack.pop()
+                descripcion.append('*')
+                nodos.append(('*', (hijo,), nodos[hijo][2], nodos[hijo][3], nodos[hijo][4]))
+                cacheable[hijo] = True
+            elif token.value in {'.', '|'}:
+                derecho = stack.pop()
+                izquierdo = stack.pop()
+                descripcion.append(token.value)
+                nodos.append((token.value, (izquierdo, derecho), nodos[izquierdo][2],
+                              nodos[izquierdo][3], nodos[izquierdo][4] + nodos[derecho][4]))
+                # El operando izquierdo de '.' que también es '.' es un eslabón de la cadena
+                if not (token.value == '.' and nodos[izquierdo][0] == '.'):
+                    cacheable[izquierdo] = True
+                cacheable[derecho] = True
+            else:
+                raise ValueError(f"Operador no soportado por la caché: {token.value}")
+            cacheable.append(False)
+            stack.append(idx)
+
+        if len(stack) != 1:
+            raise ValueError("La expresión postfija está incompleta.")
+        raiz = stack.pop()
+        cacheable[raiz] = True
+        for idx, nodo in enumerate(nodos):
+            if nodo[0] == 'hoja' or nodo[4] < self.min_posiciones:
+                cacheable[idx] = False
+        return nodos, descripcion, cacheable, raiz
+
+    def compilar(self, postfix):
+        """Devuelve el Fragmento de toda la expresión, reutilizando la caché."""
+        nodos, descripcion, cacheable, raiz = self.analizar(postfix)
+        total = nodos[raiz][4]
+        followpos = {}
+        simbolos = [None] * total
+        chars = [None] * total
+        resultados = {}  # idx -> (nullable, firstpos, lastpos) en posiciones absolutas
+
+        # Recorrido en postorden iterativo (las concatenaciones largas son muy profundas)
+        pendientes = [(raiz, False, None)]
+        while pendientes:
+            idx, expandido, clave = pendientes.pop()
+            op, hijos, inicio, base, tam = nodos[idx]
+            if not expandido:
+                if cacheable[idx]:
+                    clave = tuple(descripcion[inicio:idx + 1])
+                    entrada = self.entradas.get(clave)
+                    if entrada is not None:
+                        self.entradas.move_to_end(clave)
+                        self.injertar(entrada, base, followpos, simbolos, chars)
+                        resultados[idx] = (entrada.nullable, desplazar(entrada.firstpos, base),
+                                           desplazar(entrada.lastpos, base))
+                        self.aciertos += 1
+                        continue
+                pendientes.append((idx, True, clave))
+                pendientes.extend((hijo, False, None) for hijo in reversed(hijos))
+                continue
+
+            if op == 'hoja':
+                pos = base + 1
+                valor, conjunto = descripcion[idx]
+                followpos[pos] = set()
+                simbolos[base] = valor
+                chars[base] = conjunto or frozenset({valor})
+                resultados[idx] = (valor == 'ε', frozenset({pos}), frozenset({pos}))
+            elif op == '*':
+                _, first, last = resultados.pop(hijos[0])
+                # Para cada p en lastpos(hijo), followpos[p] += firstpos(hijo)
+                for pos in last:
+                    followpos[pos].update(first)
+                resultados[idx] = (True, first, last)
+            elif op == '.':
+                null_izq, first_izq, last_izq = resultados.pop(hijos[0])
+                null_der, first_der, last_der = resultados.pop(hijos[1])
+                # Para cada p en lastpos(izquierdo), followpos[p] += firstpos(derecho)
+                for pos in last_izq:
+                    followpos[pos].update(first_der)
+                resultados[idx] = (null_izq and null_der,
+                                   first_izq | first_der if null_izq else first_izq,
+                                   last_der | last_izq if null_der else last_der)
+            else:
+                null_izq, first_izq, last_izq = resultados.pop(hijos[0])
+                null_der, first_der, last_der = resultados.pop(hijos[1])
+                resultados[idx] = (null_izq or null_der, first_izq | first_der,
+                                   last_izq | last_der)
+
+            if cacheable[idx]:
+                self.fallos += 1
+                self.guardar(clave, resultados[idx], base, tam, followpos, simbolos, chars)
+
+        nullable, firstpos, lastpos = resultados[raiz]
+        return Fragmento(total, nullable, firstpos, lastpos, followpos, simbolos, chars)
+
+    def injertar(self, entrada, base, followpos, simbolos, chars):
+        """Copia una entrada de la caché en la expresión actual, a partir de 'base'."""
+        for pos, siguientes in entrada.followpos.items():
+            followpos[pos + base] = {p + base for p in siguientes}
+        simbolos[base:base + entrada.tam] = entrada.simbolos
+        chars[base:base + entrada.tam] = entrada.chars
+
+    def guardar(self, clave, resultado, base, tam, followpos, simbolos, chars):
+        """
+        Materializa el subárbol recién calculado con posiciones relativas. En este
+        momento su followpos solo contiene aristas internas: las que salen hacia el
+        resto de la expresión las agregan después sus ancestros.
+        """
+        nullable, firstpos, lastpos = resultado
+        interno = {pos - base: desplazar(followpos[pos], -base)
+                   for pos in range(base + 1, base + tam + 1)}
+        self.entradas[clave] = Fragmento(tam, nullable, desplazar(firstpos, -base),
+                                         desplazar(lastpos, -base), interno,
+                                         tuple(simbolos[base:base + tam]),
+                                         tuple(chars[base:base + tam]))
+        if self.max_entradas is not None and len(self.entradas) > self.max_entradas:
+            self.entradas.popitem(last=False)
+
+    def construir_dfa(self, postfix):
+        """Equivalente a DFA(SyntaxTree(postfix)), pero usando los subárboles cacheados."""
+        fragmento = self.compilar(postfix)
+        pos_to_symbol = {pos: simbolo for pos, simbolo in enumerate(fragmento.simbolos, 1)}
+        pos_to_chars = {pos: chars for pos, chars in enumerate(fragmento.chars, 1)}
+        return DFA.from_followpos(fragmento.firstpos, fragmento.followpos,
+                                  pos_to_symbol, pos_to_chars)
+
+
+if __name__ == "__main__":
+    from models.regex_parser import RegexParser
+
+    fecha = "([0-9][0-9][0-9][0-9]\\-[0-9][0-9]\\-[0-9][0-9])"
+    ip = "([0-9]+\\.[0-9]+\\.[0-9]+\\.[0-9]+)"
+    patrones = [f"a{fecha}b#", f"{fecha}x{ip}#", f"(c|d){ip}{fecha}#"]
+
+    cache = SubtreeCache()
+    for regex in patrones:
+        dfa = cache.construir_dfa(RegexParser(regex).parse())
+        print(f"{regex}: {len(dfa.states)} estados, aciertos={cache.aciertos} fallos={cache.fallos}")
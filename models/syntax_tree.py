@@ -6,15 +6,19 @@ class NodoBase:
         self.nullable = False
         self.firstpos = set()
         self.lastpos = set()
+        # Grupos de captura que abarcan exactamente este subárbol
+        self.grupos = []
 
     # Método polimórfico a sobrescribir en hijos
     def to_dot(self, dot):
         pass
 
 class NodoHoja(NodoBase):
-    def __init__(self, valor, posicion):
+    def __init__(self, valor, posicion, simbolos=None):
         super().__init__(valor)
         self.posicion = posicion
+        # Caracteres que acepta la hoja: una clase '[abc]' ocupa una sola posición
+        self.simbolos = frozenset(simbolos) if simbolos else frozenset({valor})
         self.firstpos.add(posicion)
         self.lastpos.add(posicion)
         self.nullable = (valor == 'ε')
@@ -98,7 +102,8 @@ class SyntaxTree:
         for token in self.postfix:
             # token es un Symbol. Para hojas comparamos token.value
             if (token.value.isalnum() or token.value == '#') or not token.is_operator:
-                nodo_hoja = NodoHoja(token.value, self.posicion_actual)
+                nodo_hoja = NodoHoja(token.value, self.posicion_actual,
+                                     getattr(token, 'chars', None))
                 stack.append(nodo_hoja)
                 self.posicion_actual += 1
             elif token.value == '*':  # Nodo unario
@@ -108,6 +113,8 @@ class SyntaxTree:
                 derecho = stack.pop()
                 izquierdo = stack.pop()
                 stack.append(NodoBinario(token.value, izquierdo, derecho))
+            elif token.value == '()':  # Cierre de un grupo de captura
+                stack[-1].grupos.append(token.group)
         # El último nodo en el stack es la raíz
 
         return stack.pop()
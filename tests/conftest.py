@@ -0,0 +1,17 @@
+# tests/conftest.py
+
+import pytest
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.mindfa import minimize_dfa
+
+
+@pytest.fixture
+def construir_dfa():
+    """Pipeline regex -> postfija -> árbol -> AFD (mínimo, salvo minimizar=False)."""
+    def construir(regex, minimizar=True):
+        dfa = DFA(SyntaxTree(RegexParser(regex).parse()))
+        return minimize_dfa(dfa) if minimizar else dfa
+    return construir
@@ -0,0 +1,38 @@
+# tests/test_accelerated_matcher.py
+
+import random
+
+from models.accelerated_matcher import AcceleratedMatcher, analizar_aceleracion
+
+
+def test_estados_acelerables(construir_dfa):
+    dfa = construir_dfa("[a-c]*x#")
+    acelerables = analizar_aceleracion(dfa)
+    bucles, escapes = acelerables[dfa.initial_state]
+    assert bucles == {"a", "b", "c"}
+    assert escapes == {"x"}
+    assert analizar_aceleracion(dfa, min_simbolos=4) == {}
+
+
+def test_equivale_a_simulate(construir_dfa):
+    random.seed(3)
+    for regex in ["(a|b)*abb#", "[a-c]*x[0-9]*#", "a(b|c)*d#", "abc#"]:
+        dfa = construir_dfa(regex)
+        matcher = AcceleratedMatcher(dfa)
+        for _ in range(500):
+            s = "".join(random.choice("abcdx09") for _ in range(random.randint(0, 12)))
+            assert matcher.simulate(s) == dfa.simulate(s), (regex, s)
+        assert matcher.simulate("bbbbabb") == dfa.simulate("bbbbabb")
+
+
+def test_rachas_largas_y_cortas(construir_dfa):
+    random.seed(5)
+    for regex in ["(a|b)*abb#", "[a-c]*x[0-9]*#"]:
+        dfa = construir_dfa(regex)
+        for pasos_cortos in (1, 3, 8):
+            matcher = AcceleratedMatcher(dfa, pasos_cortos=pasos_cortos)
+            for _ in range(200):
+                # Rachas de largo variable, con y sin sesgo hacia un símbolo
+                s = "".join(random.choice("ab") * random.randint(1, 20)
+                            + random.choice("abcx09z") for _ in range(random.randint(0, 6)))
+                assert matcher.simulate(s) == dfa.simulate(s), (regex, pasos_cortos, s)
@@ -0,0 +1,24 @@
+# tests/test_batch_matcher.py
+
+import pickle
+
+from models.dfa_table import TablaDFA
+from models.batch_matcher import BatchMatcher
+
+CADENAS = ["", "abb", "aabb", "ababb", "abab", "c", "babb", "abbabb", "bbbb"]
+
+
+def test_tabla_equivale_al_dfa(construir_dfa):
+    dfa = construir_dfa("(a|b)*abb#")
+    tabla = pickle.loads(pickle.dumps(TablaDFA.desde_dfa(dfa)))
+    for s in CADENAS:
+        assert tabla.simulate(s) == dfa.simulate(s)
+
+
+def test_batch_conserva_el_orden(construir_dfa):
+    dfa = construir_dfa("(a|b)*abb#")
+    cadenas = CADENAS * 50
+    with BatchMatcher(dfa, procesos=2, tam_bloque=7) as matcher:
+        resultados = matcher.match(cadenas)
+    assert len(resultados) == len(cadenas)
+    assert [bool(r) for r in resultados] == [dfa.simulate(s) for s in cadenas]
@@ -0,0 +1,37 @@
+# tests/test_bulk_compiler.py
+
+from models.bulk_compiler import compilar_en_lote, cargar_bundle, leer_reglas
+from controllers.bulk_controller import run_bulk
+
+PATRONES = ["(a|b)*abb#", "[0-9]+#", "(foo|bar)#", "a(b#", "[a-z#"]
+
+
+def test_errores_no_abortan_el_lote():
+    for procesos in (1, 2):
+        resultado = compilar_en_lote(PATRONES, procesos=procesos, tam_bloque=2)
+        assert sorted(resultado.errores) == [3, 4]
+        assert resultado.tablas[3] is None and resultado.tablas[4] is None
+        assert resultado.tablas[0].simulate("aabb")
+        assert resultado.tablas[1].simulate("123")
+        assert resultado.tablas[2].simulate("bar")
+        assert not resultado.tablas[2].simulate("ba")
+
+
+def test_cli_escribe_bundle(tmp_path):
+    reglas = tmp_path / "reglas.txt"
+    reglas.write_text("\n".join(PATRONES[:3]) + "\n\n", encoding="utf-8")
+    salida = tmp_path / "reglas.bundle"
+    assert run_bulk([str(reglas), "-o", str(salida), "-p", "1"]) == 0
+
+    bundle = cargar_bundle(salida)
+    assert bundle.patrones == leer_reglas(reglas) == PATRONES[:3]
+    assert bundle.errores == {}
+    assert [t.simulate("abb") for t in bundle.tablas] == [True, False, False]
+
+
+def test_marcador_de_fin_opcional():
+    resultado = compilar_en_lote(["(a|b)*abb", "(foo|bar)", "a\\#", "(a|b)*abb#"], procesos=1)
+    assert resultado.errores == {}
+    assert [t.simulate("aabb") for t in resultado.tablas] == [True, False, False, True]
+    assert resultado.tablas[1].simulate("foo")
+    assert resultado.tablas[2].simulate("a#")
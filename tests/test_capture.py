@@ -0,0 +1,53 @@
+# tests/test_capture.py
+
+import re
+from itertools import product
+
+from models.regex_parser import RegexParser
+from models.capture import TaggedDFA, benchmark
+
+
+def comparar_con_re(regex, alfabeto, largo_max):
+    tagged = TaggedDFA(regex)
+    patron = re.compile(regex[:-1])
+    for largo in range(largo_max + 1):
+        for tupla in product(alfabeto, repeat=largo):
+            s = "".join(tupla)
+            m = patron.fullmatch(s)
+            assert tagged.groups(s) == (m.groups() if m else None), (regex, s)
+            if m:
+                esperado = [None if m.span(k) == (-1, -1) else m.span(k)
+                            for k in range(patron.groups + 1)]
+                assert tagged.match(s) == esperado
+
+
+def test_grupos_como_re():
+    comparar_con_re("(a)(b|c)(d)#", "abcd", 3)
+    comparar_con_re("(ab)+#", "ab", 6)
+    comparar_con_re("((a)b)+#", "ab", 6)
+    comparar_con_re("((a|b)c)*d#", "abcd", 5)
+    comparar_con_re("a(b(c)d)+#", "abcd", 7)
+    comparar_con_re("([0-9]+)\\-([a-z])#", "01-ab", 4)
+
+
+def test_grupos_anulables_y_ambiguos_como_re():
+    comparar_con_re("([a-z]+)\\=([a-z0-9]*)#", "k=1", 4)
+    comparar_con_re("(a*)(b)#", "ab", 4)
+    comparar_con_re("(a*)*(b*)#", "ab", 4)
+    comparar_con_re("((a|aa))+#", "a", 6)
+    comparar_con_re("(a|ab)(c|bcd)(d*)#", "abcd", 5)
+    comparar_con_re("((a*)|b)*c#", "abc", 5)
+
+
+def test_marcadores_solo_en_modo_capturas():
+    parser = RegexParser("(a)(b)#")
+    assert "()" not in [str(t) for t in parser.parse()]
+    parser = RegexParser("(a)(b)#", captures=True)
+    assert [str(t) for t in parser.parse()].count("()") == 2
+    assert parser.num_groups == 2
+
+
+def test_benchmark_cuenta_diferencias():
+    cadenas = ["k=", "key=v1", "=x", "ab=12c"]
+    _, _, distintos = benchmark("([a-z]+)\\=([a-z0-9]*)#", cadenas, 1)
+    assert distintos == 0
@@ -0,0 +1,42 @@
+# tests/test_dictionary_dfa.py
+
+import random
+
+import pytest
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.mindfa import minimize_dfa
+from models.dictionary_dfa import es_alternancia_literal, construir_dfa_diccionario
+
+
+def test_detecta_alternancia_literal():
+    assert es_alternancia_literal("(foo|bar|baz)#") == ["foo", "bar", "baz"]
+    assert es_alternancia_literal("abc#") == ["abc"]
+    assert es_alternancia_literal("(a\\.b|c)#") == ["a.b", "c"]
+    assert es_alternancia_literal("foo|bar#") is None
+    assert es_alternancia_literal("(foo|ba*r)#") is None
+    assert es_alternancia_literal("(foo||bar)#") is None
+    assert es_alternancia_literal("(a)(b)#") is None
+    assert es_alternancia_literal("(foo|bar)") is None
+
+
+def test_mismo_lenguaje_y_minimo():
+    random.seed(7)
+    palabras = sorted({"".join(random.choice("abc") for _ in range(random.randint(1, 6)))
+                       for _ in range(60)})
+    regex = "(" + "|".join(palabras) + ")#"
+    esperado = minimize_dfa(DFA(SyntaxTree(RegexParser(regex).parse())))
+    dfa = construir_dfa_diccionario(es_alternancia_literal(regex))
+
+    assert len(dfa.states) == len(esperado.states)
+    assert len(dfa.accepting_states) == len(esperado.accepting_states)
+    for _ in range(2000):
+        s = "".join(random.choice("abcd") for _ in range(random.randint(0, 7)))
+        assert dfa.simulate(s) == (s in palabras), s
+
+
+def test_lista_vacia():
+    with pytest.raises(ValueError):
+        construir_dfa_diccionario([])
@@ -0,0 +1,67 @@
+# tests/test_fuzzy_matcher.py
+
+import random
+from itertools import product
+
+import pytest
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.mindfa import minimize_dfa
+from models.fuzzy_matcher import FuzzyMatcher
+
+
+def levenshtein(a, b):
+    fila = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        anterior, fila[0] = fila[0], i
+        for j, cb in enumerate(b, 1):
+            anterior, fila[j] = fila[j], min(fila[j] + 1, fila[j - 1] + 1, anterior + (ca != cb))
+    return fila[-1]
+
+
+def distancia_bruta(palabras, cadena, k):
+    d = min(levenshtein(cadena, w) for w in palabras)
+    return d if d <= k else None
+
+
+@pytest.mark.parametrize("regex", ["(abc|abd|ca)#", "(ab)*c#", "a[bc]*#"])
+def test_fullmatch_y_search_contra_fuerza_bruta(regex):
+    dfa = minimize_dfa(DFA(SyntaxTree(RegexParser(regex).parse())))
+    palabras = ["".join(t) for largo in range(8) for t in product("abcd", repeat=largo)
+                if dfa.simulate("".join(t))]
+    random.seed(5)
+    for k in (0, 1, 2):
+        matcher = FuzzyMatcher(dfa, k)
+        cadenas = ["".join(random.choice("abcd") for _ in range(random.randint(0, 5)))
+                   for _ in range(60)]
+        assert matcher.batch(cadenas) == [distancia_bruta(palabras, s, k) for s in cadenas]
+        for s in cadenas[:20]:
+            subcadenas = {s[i:j] for i in range(len(s) + 1) for j in range(i, len(s) + 1)}
+            esperado = [distancia_bruta(palabras, sub, k) for sub in subcadenas]
+            esperado = min((d for d in esperado if d is not None), default=None)
+            assert matcher.search(s) == esperado, (regex, k, s)
+
+
+def test_parametros_invalidos():
+    dfa = DFA(SyntaxTree(RegexParser("ab#").parse()))
+    with pytest.raises(ValueError):
+        FuzzyMatcher(dfa, -1)
+    with pytest.raises(ValueError):
+        FuzzyMatcher(dfa, 1).batch(["ab"], modo="otro")
+
+
+def test_caches_acotadas():
+    dfa = DFA(SyntaxTree(RegexParser("(a|b)*abb#").parse()))
+    matcher = FuzzyMatcher(dfa, 2, max_estados=4)
+    completo = FuzzyMatcher(dfa, 2)
+    random.seed(1)
+    for _ in range(50):
+        s = "".join(random.choice("abc") for _ in range(10))
+        assert matcher.fullmatch(s) == completo.fullmatch(s)
+        assert matcher.search(s) == completo.search(s)
+    assert len(matcher.estados) <= 4
+    assert len(matcher.cache_fullmatch) <= 4
+    assert len(matcher.cache_search) <= 4
+    assert len(matcher.distancias) <= 4
@@ -0,0 +1,74 @@
+# tests/test_regex_optimizer.py
+
+from itertools import product
+
+from models.regex_parser import RegexParser
+from models.regex_optimizer import RegexOptimizer
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.subtree_cache import SubtreeCache
+
+
+def construir(regex):
+    postfix = RegexParser(regex).parse()
+    optimizer = RegexOptimizer(postfix)
+    optimizado = optimizer.optimize()
+    return DFA(SyntaxTree(postfix)), DFA(SyntaxTree(optimizado)), optimizer
+
+
+def cadenas(alfabeto, largo_max):
+    for largo in range(largo_max + 1):
+        for tupla in product(alfabeto, repeat=largo):
+            yield "".join(tupla)
+
+
+def test_mismo_lenguaje():
+    patrones = [
+        "(a|a)#",
+        "((a*)*)b#",
+        "((x|y)|x)*#",
+        "(ab|ac|ad)#",
+        "(ac|bc|abc)#",
+        "((a*|b)*)a#",
+        "(a*a*b)#",
+        "([a-c]|b|d)x#",
+        "((a|b)*abb|aabb)#",
+    ]
+    for regex in patrones:
+        original, optimizado, _ = construir(regex)
+        for s in cadenas("abcdxy", 4):
+            assert original.simulate(s) == optimizado.simulate(s), (regex, s)
+
+
+def test_reduce_posiciones():
+    _, _, optimizer = construir("((a|a)(b*)*(x|y)|x[a-z]c|xyc)#")
+    assert optimizer.posiciones_antes == 37
+    assert optimizer.posiciones_despues == 7
+    assert optimizer.reporte() == "Posiciones: 37 -> 7"
+
+
+def test_alternancia_de_caracteres_en_una_clase():
+    postfix = RegexOptimizer(RegexParser("[a-z]#").parse()).optimize()
+    assert [str(t) for t in postfix] == ['[a-z]', '#', '.']
+
+
+def test_alternancia_larga():
+    palabras = ["".join(t) for t in product("abcd", repeat=5)]  # 1024 palabras
+    postfix = RegexParser("(" + "|".join(palabras) + ")x#").parse()
+    optimizer = RegexOptimizer(postfix)
+    optimizado = DFA(SyntaxTree(optimizer.optimize()))
+    assert optimizer.posiciones_despues < optimizer.posiciones_antes
+    for s in ["abcdax", "dddddx", "aaaaa", "abcdx", "abcdaxx"]:
+        assert optimizado.simulate(s) == (s[:-1] in palabras and s.endswith("x"))
+
+
+def test_prefijo_comun_largo():
+    # El árbol de 1000 factores es demasiado profundo para DFA.compute_followpos
+    # (recursivo); SubtreeCache construye el AFD de forma iterativa
+    prefijo = "a" * 1000
+    postfix = RegexParser("(" + prefijo + "[0-9]|" + prefijo + "x*)#").parse()
+    optimizer = RegexOptimizer(postfix)
+    optimizado = SubtreeCache().construir_dfa(optimizer.optimize())
+    assert optimizer.posiciones_despues == 1003
+    for s in [prefijo + "5", prefijo + "xx", prefijo, prefijo[1:] + "5", prefijo + "5x"]:
+        assert optimizado.simulate(s) == (s in (prefijo + "5", prefijo + "xx", prefijo)), s
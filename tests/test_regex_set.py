@@ -0,0 +1,48 @@
+# tests/test_regex_set.py
+
+from itertools import product
+
+import pytest
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.regex_set import RegexSet
+
+REGLAS = ["(a|b)*abb", "a+", "ab*", "(ab|ba)*", "b[a-c]", "abb#"]
+
+
+def test_coincide_con_un_dfa_por_regla():
+    individuales = [DFA(SyntaxTree(RegexParser(r.rstrip('#') + "#").parse())) for r in REGLAS]
+    conjunto = RegexSet(REGLAS)
+    fragmentado = RegexSet(REGLAS, max_posiciones=8)
+    assert len(conjunto.shards) == 1
+    assert len(fragmentado.shards) > 1
+    for largo in range(5):
+        for tupla in product("abc", repeat=largo):
+            s = "".join(tupla)
+            esperado = [i for i, dfa in enumerate(individuales) if dfa.simulate(s)]
+            assert conjunto.match(s) == esperado, s
+            assert fragmentado.match(s) == esperado, s
+
+
+def test_ids_de_diccionario():
+    conjunto = RegexSet({"numero": "[0-9]+", "cero": "0"})
+    assert conjunto.match("0") == ["numero", "cero"]
+    assert conjunto.match("42") == ["numero"]
+    assert conjunto.match("x") == []
+    assert len(conjunto) == 2
+
+
+def test_miles_de_palabras_clave():
+    palabras = ["".join(t) for t in product("abcdefgh", repeat=4)][:3000]
+    conjunto = RegexSet(palabras)
+    assert len(conjunto) == 3000
+    assert conjunto.match("abcd") == [palabras.index("abcd")]
+    assert conjunto.match("abc") == []
+    assert RegexSet(["a"] * 999).match("a") == list(range(999))
+
+
+def test_error_de_recursion_nombra_la_regla():
+    with pytest.raises(ValueError, match="'r7'"):
+        RegexSet({"r7": "a" + "*" * 5000})
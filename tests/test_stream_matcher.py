@@ -0,0 +1,29 @@
+# tests/test_stream_matcher.py
+
+from models.stream_matcher import StreamMatcher
+
+
+def test_fragmentos_equivalen_a_simulate(construir_dfa):
+    dfa = construir_dfa("(a|b)*abb#", minimizar=False)
+    matcher = StreamMatcher(dfa)
+    for s in ["", "abb", "aabb", "abab", "ababbbbabb"]:
+        for corte in range(len(s) + 1):
+            matcher.reset()
+            matcher.feed(s[:corte])
+            matcher.feed(s[corte:])
+            assert matcher.is_accepting() == dfa.simulate(s)
+
+
+def test_deja_de_consumir_en_estado_muerto(construir_dfa):
+    matcher = StreamMatcher(construir_dfa("abc#", minimizar=False))
+    assert matcher.feed("ab")
+    assert not matcher.feed("xc")
+    assert matcher.is_dead()
+    assert matcher.consumed == 2
+    assert not matcher.feed("abc")
+    assert matcher.consumed == 2
+
+    matcher.reset()
+    assert not matcher.is_dead()
+    matcher.feed("abc")
+    assert matcher.is_accepting()
@@ -0,0 +1,63 @@
+# tests/test_subtree_cache.py
+
+from models.regex_parser import RegexParser
+from models.syntax_tree import SyntaxTree
+from models.dfa import DFA
+from models.subtree_cache import SubtreeCache
+
+FECHA = "([0-9][0-9]\\-[0-9][0-9])"
+PATRONES = [
+    "(a|b)*abb#",
+    f"x{FECHA}y#",
+    f"({FECHA}|z)*{FECHA}#",
+    f"(ab|{FECHA})(c*)*#",
+]
+
+
+def test_mismo_followpos_que_el_arbol():
+    cache = SubtreeCache()
+    for regex in PATRONES:
+        postfix = RegexParser(regex).parse()
+        esperado = DFA(SyntaxTree(postfix))
+        dfa = cache.construir_dfa(postfix)
+        assert dfa.initial_positions == esperado.initial_positions
+        assert dfa.pos_to_symbol == esperado.pos_to_symbol
+        assert {p: set(s) for p, s in dfa.followpos.items()} == esperado.followpos
+        assert dfa.states == esperado.states
+        assert dfa.accepting_states == esperado.accepting_states
+        for s in ["abb", "x12-34y", "12-3412-34", "z12-34", "abccc", "12-34c"]:
+            assert dfa.simulate(s) == esperado.simulate(s)
+
+
+def test_reutiliza_subarboles_comunes():
+    cache = SubtreeCache()
+    cache.construir_dfa(RegexParser(f"x{FECHA}#").parse())
+    aciertos, fallos = cache.aciertos, cache.fallos
+    cache.construir_dfa(RegexParser(f"y{FECHA}#").parse())
+    # El grupo de la fecha se injerta completo desde la caché
+    assert cache.aciertos - aciertos == 1
+    # Solo se compilan la raíz nueva y sus eslabones no cacheados
+    assert cache.fallos - fallos == 1
+
+
+def test_limite_de_entradas():
+    cache = SubtreeCache(max_entradas=3)
+    for regex in PATRONES:
+        cache.construir_dfa(RegexParser(regex).parse())
+    assert len(cache.entradas) <= 3
+
+
+def test_concatenacion_larga():
+    fragmento = SubtreeCache().compilar(RegexParser("ab" * 3000 + "#").parse())
+    assert fragmento.tam == 6001
+    assert fragmento.followpos[1] == {2}
+    assert fragmento.followpos[6000] == {6001}
+    assert fragmento.simbolos[-1] == "#"
+
+
+def test_claves_se_desalojan_con_sus_entradas():
+    cache = SubtreeCache(max_entradas=5)
+    for i in range(40):
+        regex = "(" + "|".join(["ab", "cd", "e" * (i + 2)]) + ")*x#"
+        cache.construir_dfa(RegexParser(regex).parse())
+    assert len(cache.entradas) <= 5
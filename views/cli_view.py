@@ -25,3 +25,10 @@ def show_simulation_result(string, accepted):
 def show_message(msg):
     """Muestra un mensaje cualquiera por consola."""
     print(msg)
+
+def show_bulk_result(resultado, ruta):
+    """Muestra el resumen de una compilación en lote y los errores por patrón."""
+    total = len(resultado.patrones)
+    print(f"{total - len(resultado.errores)}/{total} patrones compilados -> {ruta}")
+    for idx, error in sorted(resultado.errores.items()):
+        print(f"  Patrón {idx + 1} '{resultado.patrones[idx]}': {error}")